@@ -7,12 +7,217 @@ Supports: TXT, PDF, DOCX, DOC, XLSX, XLS, JPG, PNG, JPEG (OCR)
 See SKILL.md for usage.
 """
 
+import asyncio
+import codecs
+import gzip
+import hashlib
+import mmap
+import os
+import re
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 import zipfile
 import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+
+def _fast_zlib():
+    """
+    Return isal or zlib-ng's zlib module if installed, else None.
+
+    Both are drop-in zlib replacements with SIMD-accelerated inflate,
+    typically 2-4x faster than stock zlib.
+    """
+    try:
+        from isal import isal_zlib
+        return isal_zlib
+    except ImportError:
+        pass
+    try:
+        from zlib_ng import zlib_ng
+        return zlib_ng
+    except ImportError:
+        return None
+
+
+_FAST_ZLIB = _fast_zlib()
+
+
+def _zip_open(archive: zipfile.ZipFile, name: str):
+    """
+    Open a zip member for reading, inflating it with _FAST_ZLIB when available.
+
+    Only this stream's decompressor is replaced; zipfile itself is left
+    alone so other zip users in the process keep stock zlib. The swap
+    relies on private ZipExtFile attributes, so if a Python release
+    renames them the stream simply keeps stock zlib.
+    """
+    stream = archive.open(name)
+    if (_FAST_ZLIB is not None
+            and getattr(stream, '_compress_type', None) == zipfile.ZIP_DEFLATED
+            and hasattr(stream, '_decompressor')):
+        # Nothing has been inflated yet, so the swap is safe
+        stream._decompressor = _FAST_ZLIB.decompressobj(-15)
+    return stream
+
+
+# WordprocessingML tag names used by the DOCX reader
+_DOCX_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_DOCX_T = _DOCX_NS + 't'
+_DOCX_P = _DOCX_NS + 'p'
+
+# SpreadsheetML / OPC tag names used by the XLSX reader
+_XLSX_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_XLSX_SHEET = _XLSX_NS + 'sheet'
+_XLSX_ROW = _XLSX_NS + 'row'
+_XLSX_CELL = _XLSX_NS + 'c'
+_XLSX_V = _XLSX_NS + 'v'
+_XLSX_IS = _XLSX_NS + 'is'
+_XLSX_SI = _XLSX_NS + 'si'
+_XLSX_T = _XLSX_NS + 't'
+_XLSX_R = _XLSX_NS + 'r'
+_XLSX_WORKBOOK_PR = _XLSX_NS + 'workbookPr'
+_XLSX_NUMFMT = _XLSX_NS + 'numFmt'
+_XLSX_CELL_XFS = _XLSX_NS + 'cellXfs'
+_XLSX_REL_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+_PKG_RELATIONSHIP = '{http://schemas.openxmlformats.org/package/2006/relationships}Relationship'
+
+# Built-in number formats that display dates or times (ECMA-376 18.8.30)
+_XLSX_DATE_FORMAT_IDS = frozenset(range(14, 23)) | {45, 46, 47}
+# Quoted text, escaped characters and [...] sections (colours, locales),
+# except the elapsed-time tokens [h], [mm], [ss]
+_NUMFMT_LITERAL_RE = re.compile(r'"[^"]*"|\\.|\[(?![hms]+\])[^\]]*\]', re.IGNORECASE)
+_NUMFMT_DATE_RE = re.compile(r'[dmyhs]', re.IGNORECASE)
+_NUMFMT_ELAPSED_RE = re.compile(r'\[[hms]+\]', re.IGNORECASE)
+
+# Serial day 0 of the two Excel date systems (1900 counts a fake 1900-02-29)
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+_EXCEL_EPOCH_1904 = datetime(1904, 1, 1)
+
+
+def _excel_date_text(value: float, date1904: bool, elapsed: bool) -> str:
+    """
+    Render an Excel date serial the way openpyxl's values print (datetime, time or timedelta).
+
+    Serials outside the datetime range become '#VALUE!', as in openpyxl,
+    instead of failing the whole workbook.
+    """
+    try:
+        if elapsed:
+            return str(timedelta(milliseconds=round(value * 86_400_000)))
+
+        day, fraction = divmod(value, 1)
+        diff = timedelta(milliseconds=round(fraction * 86_400_000))
+        if 0 <= value < 1 and diff.days == 0:
+            # Time of day only
+            return str((datetime.min + diff).time())
+        if date1904:
+            return str(_EXCEL_EPOCH_1904 + timedelta(days=day) + diff)
+        if 0 < value < 60:
+            # Serials before the fictitious 1900-02-29 are one day off
+            day += 1
+        return str(_EXCEL_EPOCH + timedelta(days=day) + diff)
+    except (OverflowError, ValueError):
+        return '#VALUE!'
+
+
+def _iterparse(source, tag=None):
+    """
+    Stream XML 'end' events.
+
+    Uses lxml (C parser, tag filtering done in C) when available, then
+    defusedxml, then the standard library. Callers still check elem.tag;
+    `tag` (a tag name or tuple of names) only lets lxml skip other events.
+    """
+    try:
+        from lxml import etree
+    except ImportError:
+        pass
+    else:
+        # No entity expansion and no network access, matching defusedxml
+        return etree.iterparse(
+            source, events=('end',), tag=tag,
+            resolve_entities=False, no_network=True
+        )
+
+    try:
+        from defusedxml.ElementTree import iterparse
+    except ImportError:
+        # Fallback to standard library
+        iterparse = ET.iterparse
+    return iterparse(source, events=('end',))
+
+
+def _xlsx_rich_text(elem: ET.Element) -> str:
+    """Join text of a <si>/<is> string item (plain <t> or rich-text <r> runs)."""
+    parts = []
+    for child in elem:
+        if child.tag == _XLSX_T:
+            parts.append(child.text or '')
+        elif child.tag == _XLSX_R:
+            t = child.find(_XLSX_T)
+            if t is not None:
+                parts.append(t.text or '')
+    return ''.join(parts)
+
+
+def _join_cells(values) -> str:
+    """Join stripped cell strings with ' | ', skipping empty/blank cells."""
+    cells = (value.strip() for value in values)
+    return ' | '.join(cell for cell in cells if cell)
+
+
+class _SharedStrings:
+    """XLSX shared string table, parsed only as far as the highest index looked up."""
+
+    def __init__(self, xlsx: zipfile.ZipFile):
+        self._xlsx = xlsx
+        self._strings: List[str] = []
+        self._stream = None
+        self._events = None
+        self._exhausted = False
+
+    def __getitem__(self, index: int) -> str:
+        while index >= len(self._strings) and not self._exhausted:
+            self._advance()
+        return self._strings[index]
+
+    def _advance(self):
+        """Parse the next <si> item from xl/sharedStrings.xml."""
+        if self._events is None:
+            try:
+                self._stream = _zip_open(self._xlsx, 'xl/sharedStrings.xml')
+            except KeyError:
+                self._exhausted = True
+                return
+            self._events = _iterparse(self._stream, _XLSX_SI)
+
+        for _, elem in self._events:
+            if elem.tag == _XLSX_SI:
+                self._strings.append(_xlsx_rich_text(elem))
+                elem.clear()
+                return
+
+        self.close()
+
+    def close(self):
+        """Stop parsing and release the zip entry stream."""
+        self._exhausted = True
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
+# Default location for cached extraction results
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'document-ai-search'
 
 
 class ReadError(Exception):
@@ -20,28 +225,303 @@ class ReadError(Exception):
     pass
 
 
+class _TransientText(str):
+    """Text returned to the caller but never cached (failure notes, timeout placeholders)."""
+
+
+# PDFium is not thread-safe: every pypdfium2 call must hold this lock
+_PDFIUM_LOCK = threading.Lock()
+
+# pypdf extract_text() options: plain mode skips layout analysis, and
+# upright text only skips a rescan of every page for rotated runs.
+# Pages with no upright text (landscape output drawn through a rotated
+# CTM) are extracted again with every orientation.
+_PDF_EXTRACT_OPTIONS = {'extraction_mode': 'plain', 'orientations': (0,)}
+_PDF_EXTRACT_ROTATED_OPTIONS = {'extraction_mode': 'plain'}
+
+
+def _on_main_thread() -> bool:
+    """
+    True when called from the main thread.
+
+    read_many()/iter_read() already run one reader thread per core, so
+    readers only start their own worker processes (or use SIGALRM) from
+    the main thread. That caps the process count and avoids fork() from
+    a process whose other threads may hold locks.
+    """
+    return threading.current_thread() is threading.main_thread()
+
+
+def _can_interrupt() -> bool:
+    """True if _call_with_timeout can interrupt the call (SIGALRM on a POSIX main thread)."""
+    return hasattr(signal, 'setitimer') and _on_main_thread()
+
+
+def _call_with_timeout(func, timeout: Optional[float]):
+    """
+    Call func(), raising TimeoutError if it runs longer than `timeout` seconds.
+
+    Uses SIGALRM on POSIX main threads so the call is actually interrupted.
+    Elsewhere (Windows, reader threads) the call runs in a daemon thread and
+    is abandoned on timeout, still running; see _can_interrupt().
+    A timeout of None calls func() directly.
+    """
+    if timeout is None:
+        return func()
+
+    if _can_interrupt():
+        def _on_alarm(signum, frame):
+            raise TimeoutError
+
+        previous = signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+        try:
+            return func()
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+    outcome = {}
+
+    def _target():
+        try:
+            outcome['value'] = func()
+        except BaseException as e:
+            outcome['error'] = e
+
+    worker = threading.Thread(target=_target, daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise TimeoutError
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome.get('value')
+
+
+def _extract_pdf_pages(reader, start: int, stop: int, limit: int, timeout: Optional[float]) -> List[str]:
+    """Extract text of pages [start, stop), stopping past `limit` chars."""
+    # An abandoned (timed-out) page thread keeps reading `reader`, so without
+    # SIGALRM the rest of the document must be left alone after a timeout
+    interruptible = _can_interrupt()
+    text_parts = []
+    total = 0
+    for page_num in range(start, stop):
+        try:
+            # Bound pathological layouts so one page can't stall the search
+            page = reader.pages[page_num]
+            page_text = _call_with_timeout(
+                lambda: page.extract_text(**_PDF_EXTRACT_OPTIONS), timeout
+            )
+            if not (page_text and page_text.strip()):
+                page_text = _call_with_timeout(
+                    lambda: page.extract_text(**_PDF_EXTRACT_ROTATED_OPTIONS), timeout
+                )
+            if page_text and page_text.strip():
+                text_parts.append(page_text)
+                total += len(page_text)
+        except TimeoutError:
+            text_parts.append(_TransientText(f"[Page {page_num + 1}: extraction timeout]"))
+            if not interruptible:
+                break
+        except Exception as e:
+            # Skip problematic pages but continue
+            text_parts.append(f"[Page {page_num + 1} error: {e}]")
+        if total > limit:
+            break
+    return text_parts
+
+
+def _extract_pdf_range(path: str, start: int, stop: int, limit: int, timeout: Optional[float]) -> List[str]:
+    """Process-pool worker: reopen the PDF and extract a page range."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    if reader.is_encrypted:
+        reader.decrypt('')
+    return _extract_pdf_pages(reader, start, stop, limit, timeout)
+
+
+def _tesseract_batch(
+    images: List[str], lang: str, tesseract_cmd: str, workdir: str, threads: int
+) -> Optional[List[str]]:
+    """
+    OCR several image files with one Tesseract process.
+
+    Loading language data dominates Tesseract start-up, so the images are
+    listed in a file and read by a single run, which ends each page's text
+    with a form feed. `threads` caps Tesseract's OpenMP threads so
+    batches running side by side share the cores instead of oversubscribing.
+
+    Returns:
+        One text per image, or None if the run failed
+    """
+    listing = os.path.join(workdir, f'images-{lang}.txt')
+    with open(listing, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(images) + '\n')
+
+    try:
+        result = subprocess.run(
+            [tesseract_cmd, listing, 'stdout', '-l', lang],
+            capture_output=True,
+            timeout=60 * len(images),
+            env={**os.environ, 'OMP_THREAD_LIMIT': str(threads)}
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+
+    texts = result.stdout.decode('utf-8', errors='ignore').split('\f')
+    # The final form feed leaves one empty trailing piece
+    if len(texts) != len(images) + 1:
+        return None
+    return texts[:-1]
+
+
+def _xls_sheet_text(workbook, sheet_idx: int, limit: int) -> Tuple[str, List[str]]:
+    """Return (sheet name, row texts) for one xlrd sheet, stopping past `limit` chars."""
+    sheet = workbook.sheet_by_index(sheet_idx)
+
+    rows_text = []
+    total = 0
+    for row_idx in range(sheet.nrows):
+        # Fetch the whole row at once instead of one cell_value() call per cell.
+        # Floats that are integers print without the fraction (42.0 -> 42);
+        # empty cells become '' and are dropped by _join_cells.
+        row_text = _join_cells(
+            str(int(v)) if isinstance(v, float) and v.is_integer() else str(v)
+            for v in sheet.row_values(row_idx)
+        )
+
+        if row_text:
+            rows_text.append(row_text)
+            total += len(row_text) + 1
+            if total > limit:
+                break
+
+    name = sheet.name
+    # Release sheet memory
+    workbook.unload_sheet(sheet_idx)
+    return name, rows_text
+
+
+def _xls_sheet_text_from_path(path: str, sheet_idx: int, limit: int) -> Tuple[str, List[str]]:
+    """Process-pool worker: reopen the workbook and extract one sheet."""
+    import xlrd
+
+    workbook = xlrd.open_workbook(path, formatting_info=False, on_demand=True)
+    try:
+        return _xls_sheet_text(workbook, sheet_idx, limit)
+    finally:
+        workbook.release_resources()
+
+
+# LibreOffice allows one instance per user profile; concurrent runs fail silently
+_LIBREOFFICE_LOCK = threading.Lock()
+
+
+def _libreoffice_to_text(files: List[Path]) -> Dict[Path, str]:
+    """
+    Convert .doc files to text with LibreOffice, one process per batch.
+
+    Starting LibreOffice costs seconds, so files are converted together.
+    Output is named <stem>.txt, so files sharing a stem go in separate batches.
+
+    Returns:
+        Dict mapping each successfully converted file to its text
+    """
+    batches: List[Dict[str, Path]] = []
+    for file in files:
+        stem = file.stem.lower()
+        for batch in batches:
+            if stem not in batch:
+                batch[stem] = file
+                break
+        else:
+            batches.append({stem: file})
+
+    converted = {}
+    for batch in batches:
+        with tempfile.TemporaryDirectory() as outdir:
+            for libreoffice_cmd in ['libreoffice', 'soffice']:
+                try:
+                    with _LIBREOFFICE_LOCK:
+                        result = subprocess.run(
+                            [libreoffice_cmd, '--headless', '--convert-to', 'txt:Text',
+                             '--outdir', outdir, *(str(f) for f in batch.values())],
+                            capture_output=True,
+                            timeout=60 * len(batch)
+                        )
+                except (FileNotFoundError, subprocess.TimeoutExpired):
+                    continue
+
+                if result.returncode == 0:
+                    for file in batch.values():
+                        temp_txt = Path(outdir) / f"{file.stem}.txt"
+                        if temp_txt.exists():
+                            converted[file] = temp_txt.read_text(encoding='utf-8', errors='ignore')
+                    break
+
+    return converted
+
+
 class DocumentReader:
     """Reads text from various document formats."""
 
     # Max characters to read per document (to avoid memory issues)
     MAX_CHARS = 100000
 
-    def read(self, file: Path) -> str:
+    # Extensions not worth caching (reading them is as cheap as a lookup)
+    UNCACHED_EXTENSIONS = {'.txt', '.md'}
+    # Cache limits, enforced once per reader before its first write
+    CACHE_MAX_BYTES = 512 * 1024 * 1024
+    CACHE_MAX_AGE = 30 * 24 * 3600  # seconds
+
+    # Bytes sampled for charset detection (encoding is uniform per file)
+    TXT_DETECT_BYTES = 65536
+
+    # Longest image side (pixels) passed to OCR; larger images are downscaled
+    OCR_MAX_DIMENSION = 2000
+    # Images per Tesseract process when read_many() OCRs several at once
+    OCR_BATCH_SIZE = 8
+
+    # PDFs with at least this many pages are extracted in worker processes
+    # (pypdf fallback, single-file reads on the main thread only)
+    PDF_PARALLEL_MIN_PAGES = 8
+    # Minimum pages per worker (keeps process startup cost worthwhile)
+    PDF_PAGES_PER_WORKER = 4
+    # Seconds allowed for pypdf to extract a single page (None: no limit)
+    PDF_PAGE_TIMEOUT = 5.0
+
+    # XLS files at least this large, still short of MAX_CHARS after the
+    # first sheet, have their remaining sheets parsed in worker processes
+    # (main thread only)
+    XLS_PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = DEFAULT_CACHE_DIR,
+        max_chars: Optional[int] = None
+    ):
         """
-        Read document based on file extension.
-
         Args:
-            file: Path to the document file
-
-        Returns:
-            Extracted text content
-
-        Raises:
-            ReadError: If file cannot be read
+            cache_dir: Directory for cached extraction results, keyed by
+                (path, mtime, size). Pass None to disable caching.
+            max_chars: Override MAX_CHARS; extraction stops once this many
+                characters have been read
         """
-        ext = file.suffix.lower()
-
-        readers = {
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._cache_pruned = False
+        if max_chars is not None:
+            self.MAX_CHARS = max_chars
+        # .doc text converted ahead of time by read_many()
+        self._doc_prefetch: Dict[Path, str] = {}
+        # Image OCR text produced in batches by read_many()
+        self._image_prefetch: Dict[Path, str] = {}
+
+        # Extension dispatch table, built once per reader
+        self._readers = {
             '.txt': self._read_txt,
             '.pdf': self._read_pdf,
             '.docx': self._read_docx,
@@ -54,39 +534,461 @@ class DocumentReader:
             '.md': self._read_txt,    # Markdown as plain text
         }
 
-        reader = readers.get(ext)
+    def read(self, file: Path) -> str:
+        """
+        Read document based on file extension.
+
+        Args:
+            file: Path to the document file
+
+        Returns:
+            Extracted text content
+
+        Raises:
+            ReadError: If file cannot be read
+        """
+        ext = file.suffix.lower()
+
+        reader = self._readers.get(ext)
         if not reader:
             raise ReadError(f"Unsupported format: {ext}")
 
+        # Plain text is cheaper to re-read than to look up
+        cache_path = None
+        if self.cache_dir is not None and ext not in self.UNCACHED_EXTENSIONS:
+            cache_path = self._cache_path(file)
+            cached = self._cache_load(cache_path)
+            if cached is not None:
+                return cached
+
         try:
             text = reader(file)
+            cacheable = not isinstance(text, _TransientText)
             # Truncate if too long
             if len(text) > self.MAX_CHARS:
                 text = text[:self.MAX_CHARS] + "\n\n[Content truncated...]"
-            return text
         except ReadError:
             raise
         except Exception as e:
             raise ReadError(f"{file.name}: {type(e).__name__}: {e}")
 
-    def _read_txt(self, file: Path) -> str:
-        """Read plain text file with encoding fallback."""
-        encodings = ['utf-8', 'gbk', 'gb2312', 'latin-1']
+        if cache_path is not None and cacheable:
+            if not self._cache_pruned:
+                self._cache_pruned = True
+                self._cache_prune()
+            self._cache_store(cache_path, text)
+        return text
+
+    def _cache_path(self, file: Path) -> Optional[Path]:
+        """Cache entry for the file's current (path, mtime, size) state."""
+        try:
+            stat = file.stat()
+        except OSError:
+            return None
+        # abspath, not resolve(): no per-component readlink on every lookup
+        key = f"{os.path.abspath(file)}:{stat.st_mtime_ns}:{stat.st_size}:{self.MAX_CHARS}"
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=20).hexdigest()
+        return self.cache_dir / f"{digest}.txt.gz"
+
+    @staticmethod
+    def _cache_load(cache_path: Optional[Path]) -> Optional[str]:
+        """Return cached text, or None on a miss or unreadable entry."""
+        if cache_path is None:
+            return None
+        try:
+            with gzip.open(cache_path, 'rt', encoding='utf-8') as f:
+                return f.read()
+        except (OSError, EOFError, UnicodeDecodeError):
+            return None
+
+    def _cache_prune(self):
+        """Delete entries older than CACHE_MAX_AGE, then the oldest beyond CACHE_MAX_BYTES."""
+        entries = []
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.txt.gz'):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            return
+
+        # Newest first; superseded entries (edited files) age out
+        entries.sort(reverse=True)
+        cutoff = time.time() - self.CACHE_MAX_AGE
+        total = 0
+        for mtime, size, path in entries:
+            total += size
+            if mtime < cutoff or total > self.CACHE_MAX_BYTES:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _cache_store(cache_path: Optional[Path], text: str):
+        """Write a cache entry atomically; failures are ignored."""
+        if cache_path is None:
+            return
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def read_many(
+        self,
+        files: List[Path],
+        max_workers: Optional[int] = None,
+        progress: Optional[Callable[[int, Path], None]] = None
+    ) -> Dict[Path, Union[str, ReadError]]:
+        """
+        Read several documents concurrently.
+
+        Zip inflation, file I/O, image decoding and OCR subprocesses
+        release the GIL, so threads overlap well here. PDFium is not
+        thread-safe, so PDFs read with pypdfium2 are extracted one at a
+        time. Readers do not start their own worker processes from these
+        threads, so the thread count bounds total concurrency.
+
+        Args:
+            files: Paths to the document files
+            max_workers: Thread count (default: min(32, cpu_count * 4))
+            progress: Called as progress(done_count, file) when each file
+                finishes, in completion order
+
+        Returns:
+            Dict mapping each file to its text, or to the ReadError raised
+            for it. Keys keep the order of ``files``.
+        """
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = dict(zip(self._submit_reads(executor, files, max_workers), files))
+            done = {}
+            for count, future in enumerate(as_completed(futures), 1):
+                file = futures[future]
+                done[file] = future.result()
+                if progress:
+                    progress(count, file)
+
+        return {file: done[file] for file in files}
+
+    def iter_read(
+        self,
+        files: List[Path],
+        max_workers: Optional[int] = None
+    ) -> Iterator[Tuple[Path, Union[str, ReadError]]]:
+        """
+        Read several documents concurrently, yielding results as they finish.
+
+        Results come back in the order of ``files``. Each one is yielded as
+        soon as it and every earlier file are done, so callers can start
+        working on early documents while later ones are still being read.
+        Reading starts when iter_read() is called, not at the first next().
+
+        Args:
+            files: Paths to the document files
+            max_workers: Thread count (default: min(32, cpu_count * 4))
+
+        Yields:
+            (file, text) or (file, ReadError) tuples
+        """
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+        # Everything is submitted up front; results come back in input order
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        return self._iter_results(executor, zip(files, self._submit_reads(executor, files, max_workers)))
+
+    @staticmethod
+    def _iter_results(
+        executor: ThreadPoolExecutor,
+        pending: Iterator[Tuple[Path, Future]]
+    ) -> Iterator[Tuple[Path, Union[str, ReadError]]]:
+        """Yield (file, result) pairs in order, shutting the executor down at the end."""
+        with executor:
+            for file, future in pending:
+                yield file, future.result()
+
+    async def aread(self, file: Path) -> str:
+        """
+        Async version of read() for callers running an event loop.
+
+        Extraction runs in the default executor so the loop is not blocked.
+
+        Raises:
+            ReadError: If file cannot be read
+        """
+        return await asyncio.to_thread(self.read, file)
+
+    async def aread_many(self, files: List[Path]) -> Dict[Path, Union[str, ReadError]]:
+        """
+        Async version of read_many(); files are read concurrently.
+
+        Returns:
+            Dict mapping each file to its text, or to the ReadError raised
+            for it. Keys keep the order of ``files``.
+        """
+        return await asyncio.to_thread(self.read_many, files)
 
-        for encoding in encodings:
+    def _submit_reads(self, executor: ThreadPoolExecutor, files: List[Path], workers: int) -> List[Future]:
+        """
+        Submit read() for every file, returning futures in the order of ``files``.
+
+        Batched conversions (LibreOffice, Tesseract) run as tasks in the same
+        executor, each submitted where its first member would have been, so
+        other files keep being read and yielded meanwhile. A batch task
+        reads its own members once the conversion is done and resolves
+        their futures itself; no worker thread is ever parked waiting on a
+        batch, so the other workers keep starting batches and reads.
+        """
+        def read_one(file: Path) -> Union[str, ReadError]:
+            try:
+                return self.read(file)
+            except ReadError as e:
+                return e
+
+        def run_batch(job: Callable[[], None], members: Dict[Path, Future]):
             try:
-                return file.read_text(encoding=encoding)
-            except (UnicodeDecodeError, LookupError):
+                job()
+            except Exception:
+                # Batch failed; read() converts each file on its own
+                pass
+            for file, future in members.items():
+                try:
+                    future.set_result(read_one(file))
+                except Exception as e:
+                    future.set_exception(e)
+
+        jobs = self._doc_prefetch_jobs(files) + self._image_prefetch_jobs(files, workers)
+        job_of = {file: i for i, (members, _) in enumerate(jobs) for file in members}
+        members_of: List[Dict[Path, Future]] = [
+            {file: Future() for file in members} for members, _ in jobs
+        ]
+        started = set()
+
+        futures = []
+        for file in files:
+            i = job_of.pop(file, None)
+            if i is None:
+                # Not batched (or a repeat of a batched file)
+                futures.append(executor.submit(read_one, file))
                 continue
+            if i not in started:
+                started.add(i)
+                executor.submit(run_batch, jobs[i][1], members_of[i])
+            futures.append(members_of[i][file])
+        return futures
+
+    def _uncached(self, files: List[Path]) -> List[Path]:
+        """Files without a cache entry (all of them when caching is off)."""
+        if self.cache_dir is None:
+            return files
+        uncached = []
+        for file in files:
+            cache_path = self._cache_path(file)
+            if cache_path is None or not cache_path.exists():
+                uncached.append(file)
+        return uncached
+
+    def _doc_prefetch_jobs(self, files: List[Path]) -> List[Tuple[List[Path], Callable[[], None]]]:
+        """
+        Plan converting uncached .doc files with one LibreOffice run instead of one per file.
+
+        Returns:
+            [(files, job)]; job() fills _doc_prefetch for those files
+        """
+        docs = self._uncached([
+            f for f in files
+            if f.suffix.lower() == '.doc' and f not in self._doc_prefetch
+        ])
+        if len(docs) < 2 or not self._doc_needs_libreoffice():
+            return []
+
+        return [(docs, lambda: self._doc_prefetch.update(_libreoffice_to_text(docs)))]
+
+    def _image_prefetch_jobs(self, files: List[Path], workers: int) -> List[Tuple[List[Path], Callable[[], None]]]:
+        """
+        Plan OCR of uncached images in batches, one Tesseract process per batch instead of per image.
+
+        Args:
+            files: Files being read
+            workers: Reader threads available to run the batches
+
+        Returns:
+            [(files, job)] per batch; job() fills _image_prefetch for those files
+        """
+        images = self._uncached([
+            f for f in files
+            if self._readers.get(f.suffix.lower()) == self._read_image
+            and f not in self._image_prefetch
+        ])
+        if len(images) < 2:
+            return []
+        try:
+            import PIL  # noqa: F401
+            import pytesseract  # noqa: F401
+        except ImportError:
+            return []
+        tesseract_cmd = self._tesseract_cmd()
+        if not shutil.which(tesseract_cmd):
+            return []
+
+        # At least one batch per thread that can run them (small sets are
+        # spread over all of them); large sets fill whole batches
+        cpus = os.cpu_count() or 1
+        parallel = max(1, min(workers, cpus))
+        size = max(1, min(self.OCR_BATCH_SIZE, -(-len(images) // parallel)))
+        batches = [images[i:i + size] for i in range(0, len(images), size)]
+        # Cores left over when fewer batches than cores run at once
+        threads = max(1, cpus // min(parallel, len(batches)))
+
+        return [
+            (batch, lambda batch=batch: self._image_prefetch.update(self._ocr_batch(batch, tesseract_cmd, threads)))
+            for batch in batches
+        ]
+
+    def _ocr_batch(self, files: List[Path], tesseract_cmd: str, threads: int) -> Dict[Path, str]:
+        """OCR one batch of image files; images that fail to load are left to _read_image."""
+        with tempfile.TemporaryDirectory() as workdir:
+            prepared = {}
+            for i, file in enumerate(files):
+                try:
+                    image = self._load_ocr_image(file)
+                except Exception:
+                    continue
+                # Uncompressed PGM: cheap to write, native to Tesseract
+                path = os.path.join(workdir, f'{i}.pgm')
+                image.save(path)
+                prepared[file] = path
+
+            if not prepared:
+                return {}
+            # Try Chinese OCR first, fallback to English
+            for lang in ('chi_sim+eng', 'eng'):
+                texts = _tesseract_batch(list(prepared.values()), lang, tesseract_cmd, workdir, threads)
+                if texts is not None:
+                    return dict(zip(prepared, texts))
+        return {}
+
+    @staticmethod
+    def _doc_needs_libreoffice() -> bool:
+        """True if .doc files would fall through to LibreOffice in _read_doc."""
+        if sys.platform == "win32":
+            try:
+                import win32com.client  # noqa: F401
+                return False
+            except ImportError:
+                return True
+        return not any(shutil.which(tool) for tool in ['antiword', 'catdoc'])
+
+    def _read_txt(self, file: Path) -> str:
+        """Read plain text file with encoding detection and fallback."""
+        with open(file, 'rb') as f:
+            try:
+                # Map the file; every decode attempt reads the page cache directly
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return ''
+
+        with data:
+            encodings = ['utf-8']
+
+            # Optional: statistical detection on a bounded sample
+            try:
+                from charset_normalizer import from_bytes
+                guess = from_bytes(data[:self.TXT_DETECT_BYTES]).best()
+                if guess is not None:
+                    encodings.append(guess.encoding)
+            except ImportError:
+                pass
+
+            encodings.extend(['gbk', 'gb2312', 'latin-1'])
+
+            for encoding in encodings:
+                try:
+                    text = codecs.decode(data, encoding)
+                except (UnicodeDecodeError, LookupError):
+                    continue
+                # Universal newlines, as text-mode open() gave before mmap
+                return text.replace('\r\n', '\n').replace('\r', '\n')
 
         raise ReadError("Could not decode file with any encoding")
 
     def _read_pdf(self, file: Path) -> str:
+        """Extract text from PDF using pypdfium2, falling back to pypdf."""
+        try:
+            import pypdfium2
+        except ImportError:
+            return self._read_pdf_pypdf(file)
+        return self._read_pdf_pdfium(file, pypdfium2)
+
+    def _read_pdf_pdfium(self, file: Path, pdfium) -> str:
+        """Extract text from PDF using PDFium (C++), much faster than pypdf."""
+        try:
+            # Reader threads take turns; PDFium extraction is fast enough
+            # that serializing it costs little next to the other formats
+            with _PDFIUM_LOCK:
+                text_parts = self._pdfium_pages(file, pdfium)
+
+            text = "\n\n".join(text_parts)
+
+            if not text.strip():
+                raise ReadError("No text content found (may be image-only PDF)")
+
+            return text
+
+        except ReadError:
+            raise
+        except Exception as e:
+            raise ReadError(f"PDF read failed: {e}")
+
+    def _pdfium_pages(self, file: Path, pdfium) -> List[str]:
+        """Extract page texts with PDFium, stopping past MAX_CHARS. Caller holds _PDFIUM_LOCK."""
+        try:
+            pdf = pdfium.PdfDocument(str(file))
+        except pdfium.PdfiumError as e:
+            if 'password' in str(e).lower():
+                raise ReadError("Encrypted PDF (password protected)")
+            raise
+
+        text_parts = []
+        total = 0
+        try:
+            for page_num in range(len(pdf)):
+                try:
+                    page = pdf[page_num]
+                    textpage = page.get_textpage()
+                    page_text = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+                    if page_text and page_text.strip():
+                        text_parts.append(page_text)
+                        total += len(page_text)
+                except Exception as e:
+                    # Skip problematic pages but continue
+                    text_parts.append(f"[Page {page_num + 1} error: {e}]")
+                if total > self.MAX_CHARS:
+                    break
+        finally:
+            pdf.close()
+        return text_parts
+
+    def _read_pdf_pypdf(self, file: Path) -> str:
         """Extract text from PDF using pypdf."""
         try:
             from pypdf import PdfReader
         except ImportError:
-            raise ReadError("pypdf not installed. Run: pip install pypdf")
+            raise ReadError("No PDF library installed. Run: pip install pypdfium2 (or pypdf)")
 
         try:
             reader = PdfReader(str(file))
@@ -98,21 +1000,22 @@ class DocumentReader:
                 except Exception:
                     raise ReadError("Encrypted PDF (password protected)")
 
-            text_parts = []
-            for page_num, page in enumerate(reader.pages, 1):
-                try:
-                    page_text = page.extract_text()
-                    if page_text and page_text.strip():
-                        text_parts.append(page_text)
-                except Exception as e:
-                    # Skip problematic pages but continue
-                    text_parts.append(f"[Page {page_num} error: {e}]")
+            page_count = len(reader.pages)
+            if page_count < self.PDF_PARALLEL_MIN_PAGES or not _on_main_thread():
+                text_parts = _extract_pdf_pages(
+                    reader, 0, page_count, self.MAX_CHARS, self.PDF_PAGE_TIMEOUT
+                )
+            else:
+                text_parts = self._extract_pdf_parallel(file, page_count)
 
             text = "\n\n".join(text_parts)
 
             if not text.strip():
                 raise ReadError("No text content found (may be image-only PDF)")
 
+            # A page that timed out may extract fine on a later run
+            if any(isinstance(part, _TransientText) for part in text_parts):
+                return _TransientText(text)
             return text
 
         except ReadError:
@@ -120,32 +1023,61 @@ class DocumentReader:
         except Exception as e:
             raise ReadError(f"PDF read failed: {e}")
 
+    def _extract_pdf_parallel(self, file: Path, page_count: int) -> List[str]:
+        """Extract pages in contiguous ranges across worker processes."""
+        step = self.PDF_PAGES_PER_WORKER
+        ranges = [(lo, min(lo + step, page_count)) for lo in range(0, page_count, step)]
+        workers = max(1, min(os.cpu_count() or 1, len(ranges)))
+
+        text_parts = []
+        total = 0
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            # map() keeps page order
+            chunks = executor.map(
+                _extract_pdf_range,
+                [str(file)] * len(ranges),
+                [lo for lo, _ in ranges],
+                [hi for _, hi in ranges],
+                [self.MAX_CHARS] * len(ranges),
+                [self.PDF_PAGE_TIMEOUT] * len(ranges),
+            )
+            for chunk in chunks:
+                text_parts.extend(chunk)
+                total += sum(len(part) for part in chunk)
+                if total > self.MAX_CHARS:
+                    break
+        finally:
+            # Drop ranges not started yet once enough text is collected
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return text_parts
+
     def _read_docx(self, file: Path) -> str:
-        """Extract text from DOCX by reading XML."""
+        """Extract text from DOCX by streaming the document XML."""
         try:
             with zipfile.ZipFile(file, 'r') as docx:
                 # Check if main document exists
                 try:
-                    xml_content = docx.read('word/document.xml')
+                    stream = _zip_open(docx, 'word/document.xml')
                 except KeyError:
                     raise ReadError("Invalid DOCX structure (missing word/document.xml)")
 
-                # Parse XML with defusedxml for security
-                try:
-                    from defusedxml import ElementTree as SafeET
-                    tree = SafeET.fromstring(xml_content)
-                except ImportError:
-                    # Fallback to standard library with warning
-                    tree = ET.fromstring(xml_content)
-
-                # Extract text from all w:t elements
-                namespaces = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
-                texts = tree.findall('.//w:t', namespaces)
-
+                # Stream w:t elements instead of building the full tree
                 result = []
-                for t in texts:
-                    if t.text:
-                        result.append(t.text)
+                total = 0
+                with stream:
+                    for _, elem in _iterparse(stream, (_DOCX_T, _DOCX_P)):
+                        if elem.tag == _DOCX_T:
+                            if elem.text:
+                                result.append(elem.text)
+                                total += len(elem.text)
+                                if total > self.MAX_CHARS:
+                                    break
+                            elem.clear()
+                        elif elem.tag == _DOCX_P:
+                            # Paragraph text has been consumed; drop its subtree
+                            elem.clear()
 
                 text = ''.join(result)
 
@@ -160,30 +1092,51 @@ class DocumentReader:
             raise ReadError(f"DOCX read failed: {e}")
 
     def _read_xlsx(self, file: Path) -> str:
-        """Extract text from XLSX using openpyxl."""
+        """Extract text from XLSX by streaming the worksheet XML."""
         try:
-            from openpyxl import load_workbook
-        except ImportError:
-            raise ReadError("openpyxl not installed. Run: pip install openpyxl")
+            with zipfile.ZipFile(file, 'r') as xlsx:
+                try:
+                    sheets = self._xlsx_sheets(xlsx)
+                except KeyError:
+                    raise ReadError("Invalid XLSX structure (missing xl/workbook.xml)")
 
-        try:
-            wb = load_workbook(str(file), read_only=True, data_only=True)
-            sheets_text = []
+                date_styles, date1904 = self._xlsx_date_styles(xlsx)
+                shared_strings = _SharedStrings(xlsx)
+                names = set(xlsx.namelist())
+                sheets_text = []
+                total = 0
 
-            for sheet in wb:
-                rows_text = []
-                for row in sheet.iter_rows(values_only=True):
-                    # Filter out empty rows
-                    non_empty_cells = [str(cell) if cell is not None else '' for cell in row if cell is not None]
-                    if non_empty_cells:
-                        row_text = ' | '.join(non_empty_cells)
-                        if row_text.strip():
-                            rows_text.append(row_text)
+                try:
+                    for title, part in sheets:
+                        if total > self.MAX_CHARS:
+                            break
+                        if part not in names:
+                            continue
 
-                if rows_text:
-                    sheets_text.append(f"Sheet: {sheet.title}\n" + "\n".join(rows_text))
+                        rows_text = []
+                        with _zip_open(xlsx, part) as stream:
+                            for _, elem in _iterparse(stream, _XLSX_ROW):
+                                if elem.tag != _XLSX_ROW:
+                                    continue
+
+                                row_text = _join_cells(
+                                    self._xlsx_cell_value(cell, shared_strings, date_styles, date1904) or ''
+                                    for cell in elem.iter(_XLSX_CELL)
+                                )
+
+                                # Release parsed row to keep memory flat
+                                elem.clear()
 
-            wb.close()
+                                if row_text:
+                                    rows_text.append(row_text)
+                                    total += len(row_text) + 1
+                                    if total > self.MAX_CHARS:
+                                        break
+
+                        if rows_text:
+                            sheets_text.append(f"Sheet: {title}\n" + "\n".join(rows_text))
+                finally:
+                    shared_strings.close()
 
             if not sheets_text:
                 raise ReadError("No data found in workbook")
@@ -195,6 +1148,112 @@ class DocumentReader:
         except Exception as e:
             raise ReadError(f"XLSX read failed: {e}")
 
+    @staticmethod
+    def _xlsx_sheets(xlsx: zipfile.ZipFile) -> List[Tuple[str, str]]:
+        """Return (title, zip part name) for each sheet in workbook order."""
+        with _zip_open(xlsx, 'xl/workbook.xml') as stream:
+            sheets = [
+                (elem.get('name', ''), elem.get(_XLSX_REL_ID))
+                for _, elem in _iterparse(stream, _XLSX_SHEET)
+                if elem.tag == _XLSX_SHEET
+            ]
+
+        targets = {}
+        try:
+            with _zip_open(xlsx, 'xl/_rels/workbook.xml.rels') as stream:
+                for _, elem in _iterparse(stream, _PKG_RELATIONSHIP):
+                    if elem.tag == _PKG_RELATIONSHIP:
+                        target = elem.get('Target', '')
+                        # Targets are relative to xl/ unless absolute
+                        if target.startswith('/'):
+                            target = target[1:]
+                        else:
+                            target = 'xl/' + target
+                        targets[elem.get('Id')] = target
+        except KeyError:
+            pass
+
+        return [
+            (title, targets.get(rel_id, f'xl/worksheets/sheet{idx}.xml'))
+            for idx, (title, rel_id) in enumerate(sheets, 1)
+        ]
+
+    @staticmethod
+    def _xlsx_date_styles(xlsx: zipfile.ZipFile) -> Tuple[Dict[int, bool], bool]:
+        """
+        Find the cell styles that format numbers as dates.
+
+        Returns:
+            ({cell style index: is elapsed-time format}, uses 1904 date system)
+        """
+        date1904 = False
+        try:
+            with _zip_open(xlsx, 'xl/workbook.xml') as stream:
+                for _, elem in _iterparse(stream, _XLSX_WORKBOOK_PR):
+                    if elem.tag == _XLSX_WORKBOOK_PR:
+                        date1904 = elem.get('date1904', '0').lower() in ('1', 'true')
+                        break
+        except KeyError:
+            pass
+
+        custom = {}
+        date_styles = {}
+        try:
+            with _zip_open(xlsx, 'xl/styles.xml') as stream:
+                for _, elem in _iterparse(stream, (_XLSX_NUMFMT, _XLSX_CELL_XFS)):
+                    if elem.tag == _XLSX_NUMFMT:
+                        custom[int(elem.get('numFmtId', -1))] = elem.get('formatCode', '')
+                    elif elem.tag == _XLSX_CELL_XFS:
+                        # <xf> order gives the style index used by <c s="...">
+                        for index, xf in enumerate(elem):
+                            fmt_id = int(xf.get('numFmtId', 0))
+                            if fmt_id in custom:
+                                # Only the first (positive number) section matters
+                                fmt = _NUMFMT_LITERAL_RE.sub('', custom[fmt_id].split(';')[0])
+                                if _NUMFMT_DATE_RE.search(fmt):
+                                    date_styles[index] = bool(_NUMFMT_ELAPSED_RE.search(fmt))
+                            elif fmt_id in _XLSX_DATE_FORMAT_IDS:
+                                date_styles[index] = fmt_id == 46
+                        break
+        except KeyError:
+            pass
+
+        return date_styles, date1904
+
+    @staticmethod
+    def _xlsx_cell_value(
+        cell: ET.Element,
+        shared_strings: '_SharedStrings',
+        date_styles: Dict[int, bool],
+        date1904: bool
+    ) -> Optional[str]:
+        """Convert a <c> element to its display string, or None if empty."""
+        cell_type = cell.get('t', 'n')
+
+        if cell_type == 'inlineStr':
+            inline = cell.find(_XLSX_IS)
+            return _xlsx_rich_text(inline) if inline is not None else None
+
+        v = cell.find(_XLSX_V)
+        if v is None or v.text is None:
+            return None
+        raw = v.text
+
+        if cell_type == 's':
+            return shared_strings[int(raw)]
+        if cell_type == 'b':
+            return 'True' if raw == '1' else 'False'
+        if cell_type == 'n':
+            style = cell.get('s')
+            if style is not None and int(style) in date_styles:
+                return _excel_date_text(float(raw), date1904, date_styles[int(style)])
+            # Match openpyxl: integers stay integral, everything else is float
+            if '.' in raw or 'E' in raw or 'e' in raw:
+                return str(float(raw))
+            return str(int(raw))
+        # 'str' (formula result), 'e' (error), 'd' (ISO date)
+        return raw
+
     def _read_xls(self, file: Path) -> str:
         """Extract text from legacy XLS using xlrd."""
         try:
@@ -205,44 +1264,35 @@ class DocumentReader:
         try:
             # Open workbook with xlrd
             workbook = xlrd.open_workbook(str(file), formatting_info=False, on_demand=True)
-            sheets_text = []
-
-            for sheet_idx in range(workbook.nsheets):
-                sheet = workbook.sheet_by_index(sheet_idx)
-
-                rows_text = []
-                for row_idx in range(sheet.nrows):
-                    # Get all cell values in this row
-                    row_values = []
-                    for col_idx in range(sheet.ncols):
-                        try:
-                            cell_value = sheet.cell_value(row_idx, col_idx)
-                            # Convert to string, handling different types
-                            if cell_value == '':
-                                continue
-                            if isinstance(cell_value, float):
-                                # Check if it's an integer (e.g., 42.0 -> 42)
-                                if cell_value.is_integer():
-                                    cell_value = str(int(cell_value))
-                                else:
-                                    cell_value = str(cell_value)
-                            else:
-                                cell_value = str(cell_value).strip()
-
-                            if cell_value:
-                                row_values.append(cell_value)
-                        except Exception:
-                            continue
+            nsheets = workbook.nsheets
 
-                    if row_values:
-                        row_text = ' | '.join(row_values)
-                        rows_text.append(row_text)
+            sheets = []
+            total = 0
+            try:
+                for idx in range(nsheets):
+                    if total > self.MAX_CHARS:
+                        break
+                    # The first sheet usually fills MAX_CHARS; only large
+                    # workbooks with several sheets left repay process startup
+                    if (idx == 1 and nsheets > 2 and _on_main_thread()
+                            and file.stat().st_size >= self.XLS_PARALLEL_MIN_BYTES):
+                        workbook.release_resources()
+                        sheets.extend(self._xls_sheets_parallel(file, range(1, nsheets), self.MAX_CHARS - total))
+                        break
+                    name, rows_text = _xls_sheet_text(workbook, idx, self.MAX_CHARS - total)
+                    sheets.append((name, rows_text))
+                    total += sum(len(row) + 1 for row in rows_text)
+            finally:
+                workbook.release_resources()
 
+            sheets_text = []
+            total = 0
+            for name, rows_text in sheets:
+                if total > self.MAX_CHARS:
+                    break
                 if rows_text:
-                    sheets_text.append(f"Sheet: {sheet.name}\n" + "\n".join(rows_text))
-
-                # Release sheet memory
-                workbook.unload_sheet(sheet_idx)
+                    sheets_text.append(f"Sheet: {name}\n" + "\n".join(rows_text))
+                    total += sum(len(row) + 1 for row in rows_text)
 
             if not sheets_text:
                 raise ReadError("No data found in workbook")
@@ -254,8 +1304,25 @@ class DocumentReader:
         except Exception as e:
             raise ReadError(f"XLS read failed: {e}")
 
+    @staticmethod
+    def _xls_sheets_parallel(file: Path, indexes: range, limit: int) -> List[Tuple[str, List[str]]]:
+        """Parse independent sheets in worker processes, keeping sheet order."""
+        workers = max(1, min(len(indexes), os.cpu_count() or 1))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                _xls_sheet_text_from_path,
+                [str(file)] * len(indexes),
+                indexes,
+                [limit] * len(indexes),
+            ))
+
     def _read_doc(self, file: Path) -> str:
         """Extract text from legacy DOC using multiple methods."""
+        # Already converted by a batched LibreOffice run in read_many()
+        prefetched = self._doc_prefetch.pop(file, None)
+        if prefetched is not None:
+            return prefetched
+
         # Method 1: Try pywin32 COM automation (Windows with Word installed)
         if sys.platform == "win32":
             try:
@@ -288,23 +1355,9 @@ class DocumentReader:
                     continue
 
         # Method 3: Try LibreOffice (cross-platform)
-        for libreoffice_cmd in ['libreoffice', 'soffice']:
-            try:
-                # Convert to temp text file
-                result = subprocess.run(
-                    [libreoffice_cmd, '--headless', '--convert-to', 'txt:Text',
-                     '--outdir', str(file.parent), str(file)],
-                    capture_output=True,
-                    timeout=60
-                )
-                if result.returncode == 0:
-                    temp_txt = file.with_suffix('.txt')
-                    if temp_txt.exists():
-                        text = temp_txt.read_text(encoding='utf-8', errors='ignore')
-                        temp_txt.unlink()  # Clean up
-                        return text
-            except (FileNotFoundError, subprocess.TimeoutExpired):
-                continue
+        text = _libreoffice_to_text([file]).get(file)
+        if text is not None:
+            return text
 
         raise ReadError(
             "Could not read .doc file. Options:\n"
@@ -316,33 +1369,25 @@ class DocumentReader:
     def _read_image(self, file: Path) -> str:
         """Extract text from images using OCR (pytesseract)."""
         try:
-            from PIL import Image
+            import PIL  # noqa: F401
             import pytesseract
         except ImportError:
             raise ReadError("OCR dependencies not installed. Run: pip install pytesseract Pillow")
 
         try:
-            # Configure Tesseract path for Windows
-            if sys.platform == "win32":
-                tess_paths = [
-                    r"C:\Program Files\Tesseract-OCR\tesseract.exe",
-                    r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
-                    r"C:\Tesseract-OCR\tesseract.exe",
-                ]
-                for path in tess_paths:
-                    if Path(path).exists():
-                        pytesseract.pytesseract.tesseract_cmd = path
-                        break
+            # Already OCRed as part of a batch in read_many()
+            text = self._image_prefetch.pop(file, None)
 
-            # Open image and extract text
-            image = Image.open(file)
+            if text is None:
+                self._tesseract_cmd()
+                image = self._load_ocr_image(file)
 
-            # Try Chinese OCR first, fallback to English
-            try:
-                text = pytesseract.image_to_string(image, lang='chi_sim+eng')
-            except pytesseract.TesseractError:
-                # Chinese language data not available, use English only
-                text = pytesseract.image_to_string(image, lang='eng')
+                # Try Chinese OCR first, fallback to English
+                try:
+                    text = pytesseract.image_to_string(image, lang='chi_sim+eng')
+                except pytesseract.TesseractError:
+                    # Chinese language data not available, use English only
+                    text = pytesseract.image_to_string(image, lang='eng')
 
             if not text or not text.strip():
                 raise ReadError("No text could be extracted from image")
@@ -353,8 +1398,53 @@ class DocumentReader:
             raise
         except Exception as e:
             # OCR failures should not crash the search
-            # Return empty string with a note
-            return f"[OCR failed: {e}]"
+            # Return a note instead (not cached: Tesseract may be fixed later)
+            return _TransientText(f"[OCR failed: {e}]")
+
+    @staticmethod
+    def _tesseract_cmd() -> str:
+        """Locate Tesseract (configuring pytesseract on Windows) and return its command."""
+        import pytesseract
+
+        # Configure Tesseract path for Windows
+        if sys.platform == "win32":
+            tess_paths = [
+                r"C:\Program Files\Tesseract-OCR\tesseract.exe",
+                r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
+                r"C:\Tesseract-OCR\tesseract.exe",
+            ]
+            for path in tess_paths:
+                if Path(path).exists():
+                    pytesseract.pytesseract.tesseract_cmd = path
+                    break
+        return pytesseract.pytesseract.tesseract_cmd
+
+    def _load_ocr_image(self, file: Path):
+        """Decode an image as grayscale, downscaled to OCR_MAX_DIMENSION."""
+        from PIL import Image
+
+        # Open image, decode it fully and release the file handle
+        with Image.open(file) as source:
+            source.load()
+            if 'A' in source.getbands() or 'transparency' in source.info:
+                # Flatten onto white like pytesseract does; dropping alpha
+                # would turn transparent backgrounds black
+                image = Image.new('RGBA', source.size, 'white')
+                image.alpha_composite(source.convert('RGBA'))
+            elif source.mode.startswith('I'):
+                # 16/32-bit samples: stretch to 8 bits (convert('L') clips them to white)
+                image = source.convert('I')
+                lo, hi = image.getextrema()
+                scale = 255 / (hi - lo) if hi > lo else 1
+                image = image.point(lambda v: (v - lo) * scale)
+            else:
+                image = source
+            # Grayscale halves memory traffic; Tesseract binarizes anyway
+            image = image.convert('L')
+
+        # Cap resolution: pixels beyond ~300 DPI only add OCR time
+        image.thumbnail((self.OCR_MAX_DIMENSION, self.OCR_MAX_DIMENSION), Image.LANCZOS)
+        return image
 
 
 def main():
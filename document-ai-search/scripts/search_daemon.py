@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Search daemon - keeps document readers loaded between searches.
+
+Each CLI run otherwise pays for importing the PDF, Office and OCR libraries
+again. While the daemon is running, search_documents.py forwards its
+arguments over a Unix socket and prints the daemon's output instead.
+
+Usage:
+    python search_daemon.py [--socket PATH]
+
+See SKILL.md for usage.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+from file_reader import DEFAULT_CACHE_DIR
+
+# Default socket location, next to the caches
+DEFAULT_SOCKET = DEFAULT_CACHE_DIR / 'daemon.sock'
+
+# Optional reader dependencies imported once at daemon start-up
+_PRELOAD_MODULES = [
+    'pypdfium2', 'pypdf', 'xlrd', 'PIL.Image', 'pytesseract', 'charset_normalizer', 'lxml.etree'
+]
+
+# Line prefix marking the exit code at the end of a response
+_EXIT_MARKER = '\0'
+
+
+def forward(argv: List[str], socket_path: Path = DEFAULT_SOCKET) -> Optional[int]:
+    """
+    Run a search in the daemon, echoing its output to stdout.
+
+    Args:
+        argv: search_documents.py arguments (without the program name)
+        socket_path: Daemon socket
+
+    Returns:
+        The search's exit code, or None if no daemon is listening
+    """
+    if not hasattr(socket, 'AF_UNIX') or not Path(socket_path).exists():
+        return None
+
+    request = json.dumps({'argv': argv, 'cwd': os.getcwd()}, ensure_ascii=False)
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(str(socket_path))
+            conn.sendall(request.encode('utf-8') + b'\n')
+            with conn.makefile('r', encoding='utf-8', errors='replace') as response:
+                for line in response:
+                    if line.startswith(_EXIT_MARKER):
+                        return int(line[1:])
+                    sys.stdout.write(line)
+                    sys.stdout.flush()
+    except OSError:
+        # Stale socket or daemon gone: search in-process instead
+        return None
+    # Daemon closed the connection without finishing
+    return 1
+
+
+def _listening(socket_path: Path) -> bool:
+    """True if a daemon accepts connections on the socket."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(str(socket_path))
+        return True
+    except OSError:
+        return False
+
+
+class _LineWriter(io.TextIOBase):
+    """Text stream that sends complete lines to a client socket as they are printed."""
+
+    def __init__(self, wfile):
+        self._wfile = wfile
+        self._pending = ''
+
+    def write(self, text: str) -> int:
+        self._pending += text
+        if '\n' in self._pending:
+            done, _, self._pending = self._pending.rpartition('\n')
+            self._send(done + '\n')
+        return len(text)
+
+    def flush(self):
+        if self._pending:
+            self._send(self._pending + '\n')
+            self._pending = ''
+
+    def _send(self, text: str):
+        try:
+            self._wfile.write(text.encode('utf-8'))
+            self._wfile.flush()
+        except OSError:
+            # Client went away; finish the search anyway so caches fill
+            pass
+
+
+class _SearchHandler(socketserver.StreamRequestHandler):
+    """Run one forwarded search, streaming its output back."""
+
+    def handle(self):
+        from search_documents import build_parser, run
+
+        try:
+            request = json.loads(self.rfile.readline().decode('utf-8'))
+        except ValueError:
+            return
+
+        out = _LineWriter(self.wfile)
+        exit_code = 1
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+            try:
+                parser = build_parser()
+                parser.prog = 'search_documents.py'
+                args = parser.parse_args(request['argv'])
+                # Relative paths are relative to the client
+                args.folder = Path(request['cwd']) / args.folder
+                args.output = Path(request['cwd']) / args.output
+                exit_code = run(args, reader=self.server.readers[not args.no_cache])
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else 1
+            except Exception as e:
+                print(f"❌ Error: {e}", file=sys.stderr)
+        out.flush()
+        out._send(f"{_EXIT_MARKER}{exit_code}\n")
+
+
+class SearchDaemon(socketserver.UnixStreamServer):
+    """Unix socket server holding warm DocumentReaders (one search at a time)."""
+
+    def __init__(self, socket_path: Path = DEFAULT_SOCKET):
+        from search_documents import DocumentSearcher
+
+        self.socket_path = Path(socket_path)
+        # One reader with the extraction cache, one without (--no-cache)
+        self.readers = {
+            True: DocumentSearcher.make_reader(use_cache=True),
+            False: DocumentSearcher.make_reader(use_cache=False),
+        }
+        for module in _PRELOAD_MODULES:
+            try:
+                __import__(module)
+            except ImportError:
+                pass
+
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            # Leftover from a daemon that did not shut down cleanly
+            self.socket_path.unlink()
+        super().__init__(str(self.socket_path), _SearchHandler)
+
+    def server_close(self):
+        super().server_close()
+        with contextlib.suppress(OSError):
+            self.socket_path.unlink()
+
+
+def main():
+    """Daemon entry point."""
+    parser = argparse.ArgumentParser(description="Keep document readers loaded between searches")
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        default=DEFAULT_SOCKET,
+        help=f"Unix socket to listen on (default: {DEFAULT_SOCKET})"
+    )
+    args = parser.parse_args()
+
+    if not hasattr(socket, 'AF_UNIX'):
+        print("❌ Error: Unix sockets are not available on this platform", file=sys.stderr)
+        sys.exit(1)
+
+    if _listening(args.socket):
+        print(f"❌ Error: A search daemon is already listening on {args.socket}", file=sys.stderr)
+        sys.exit(1)
+
+    # Shut down cleanly (removing the socket) on kill as well as Ctrl+C
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    with SearchDaemon(args.socket) as daemon:
+        print(f"🔌 Search daemon listening on {args.socket} (Ctrl+C to stop)")
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -12,43 +12,187 @@ See SKILL.md for full documentation.
 """
 
 import argparse
+import contextlib
+import heapq
+import io
 import json
 import os
-import re
+import socket
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 
 # Set UTF-8 encoding for Windows console
 if sys.platform == "win32":
-    import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
 from file_reader import DocumentReader, ReadError
 
 
+# File extensions DocumentReader can extract
+SUPPORTED_EXTENSIONS = frozenset({
+    '.pdf', '.docx', '.doc', '.xlsx', '.xls', '.txt', '.md', '.jpg', '.jpeg', '.png'
+})
+
+# Formats read in worker processes: pypdf and xlrd hold the GIL, and
+# PDFium is serialized across the threads of one process
+PROCESS_EXTENSIONS = frozenset({'.pdf', '.xls'})
+
+# Directories never worth searching (VCS metadata, dependencies, build output)
+SKIP_DIRS = frozenset({
+    '.git', 'node_modules', '.venv', 'venv', '__pycache__', '.cache', 'dist', 'build'
+})
+
+# Query term separators (Chinese and English punctuation) mapped to spaces,
+# so str.split() can split on them along with any whitespace
+QUERY_SEPARATORS = str.maketrans({c: ' ' for c in ',，、;；'})
+
+
+# Static scoring rubric for semantic analysis. Identical for every batch and
+# query, so it is sent as a cacheable system prompt.
+ANALYSIS_INSTRUCTIONS = """分析以下文档与查询的语义相关性。
+
+对每个文档评估：
+1. 相关性评分 (0-100)：
+   - 90-100: 直接且全面的回答
+   - 70-89: 高度相关，部分回答
+   - 50-69: 有些相关，边缘内容
+   - 30-49: 最小相关性
+   - 0-29: 不相关
+
+2. 内容摘要 (2-3 句话)：文档讨论了什么
+
+3. 相关摘录：2-3 个最相关的段落
+
+**重要 - 使用 OR 逻辑**：
+- 如果文档的任何部分与查询的任何概念相关，即标记为相关
+- 使用语义理解，不是关键词匹配
+- 考虑同义词、相关概念、上下文含义
+
+请以 JSON 格式回复：
+{
+  "analyses": [
+    {
+      "file": "文件路径",
+      "relevance": 85,
+      "summary": "文档讨论了...",
+      "excerpts": ["摘录1", "摘录2"]
+    }
+  ]
+}"""
+
+
+def build_term_automaton(terms: List[str]):
+    """
+    Build an Aho-Corasick automaton over query terms for single-pass matching.
+
+    Returns None if pyahocorasick is not installed or there is only one
+    term (a plain substring check is already a single pass).
+    """
+    if len(set(terms)) < 2:
+        return None
+    try:
+        import ahocorasick
+    except ImportError:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+def default_workers() -> int:
+    """Default extraction worker count: leave one core for the main process."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+# DocumentReader of an extraction worker process, built by _init_worker()
+_worker_reader: Optional[DocumentReader] = None
+
+
+def _init_worker(cache_dir: Optional[Path], max_chars: int):
+    """Process-pool initializer: give the worker its own DocumentReader."""
+    global _worker_reader
+    _worker_reader = DocumentReader(cache_dir=cache_dir, max_chars=max_chars)
+    # One file per worker already fills the pool; no nested page/sheet pools
+    _worker_reader.PDF_PARALLEL_MIN_PAGES = sys.maxsize
+    _worker_reader.XLS_PARALLEL_MIN_BYTES = sys.maxsize
+
+
+def _extract_one(file: Path) -> Union[str, ReadError]:
+    """Process-pool worker: read one file, returning its text or the ReadError."""
+    try:
+        return _worker_reader.read(file)
+    except ReadError as e:
+        return e
+
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def path_score(value: str) -> int:
+    """argparse type for path relevance thresholds (1-100)."""
+    number = int(value)
+    if not 1 <= number <= 100:
+        raise argparse.ArgumentTypeError(f"must be between 1 and 100, got {value}")
+    return number
+
+
 class DocumentSearcher:
     """Main search orchestrator for AI-powered document search."""
 
     # Minimum relevance score to include in results
     RELEVANCE_THRESHOLD = 30
 
+    # Characters of each document sent for analysis
+    CONTENT_PREVIEW_CHARS = 3000
+
     def __init__(
         self,
         folder: Path,
         query: str,
         batch_size: int = 5,
         max_docs: int = 50,
-        verbose: bool = True
+        workers: Optional[int] = None,
+        path_only_threshold: Optional[int] = None,
+        include_hidden: bool = False,
+        skip_dirs: bool = True,
+        use_cache: bool = True,
+        verbose: bool = True,
+        reader: Optional[DocumentReader] = None
     ):
         self.folder = Path(folder)
         self.query = query
         self.batch_size = batch_size
         self.max_docs = max_docs
+        if workers is None:
+            workers = default_workers()
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+        self.workers = workers
+        self.path_only_threshold = path_only_threshold
+        self.include_hidden = include_hidden
+        self.skip_dirs = skip_dirs
         self.verbose = verbose
-        self.reader = DocumentReader()
+        if reader is None:
+            reader = self.make_reader(use_cache)
+        self.reader = reader
+        self._instructions_shown = False
+
+        # Split query into terms once (handle Chinese and English separators)
+        self.query_terms = [t.lower() for t in query.translate(QUERY_SEPARATORS).split()]
+        self._term_automaton = build_term_automaton(self.query_terms)
 
         # Statistics
         self.stats = {
@@ -59,6 +203,14 @@ class DocumentSearcher:
             'errors': []
         }
 
+    @classmethod
+    def make_reader(cls, use_cache: bool = True) -> DocumentReader:
+        """Create a DocumentReader that stops at the analysed preview length."""
+        # Only a preview of each document is analyzed, so stop extraction there
+        if use_cache:
+            return DocumentReader(max_chars=cls.CONTENT_PREVIEW_CHARS)
+        return DocumentReader(cache_dir=None, max_chars=cls.CONTENT_PREVIEW_CHARS)
+
     def log(self, message: str):
         """Print message if verbose mode is on."""
         if self.verbose:
@@ -66,25 +218,42 @@ class DocumentSearcher:
 
     def discover_files(self) -> List[Path]:
         """Find supported document files in folder."""
-        extensions = {'.pdf', '.docx', '.doc', '.xlsx', '.xls', '.txt', '.md', '.jpg', '.jpeg', '.png'}
-        files = []
-
         self.log(f"\n🔍 Scanning folder: {self.folder}")
 
-        for ext in extensions:
-            found = list(self.folder.rglob(f'*{ext}'))
-            files.extend(found)
-
-        # Sort and limit
-        files = sorted(files)
-        if self.max_docs and len(files) > self.max_docs:
-            files = files[:self.max_docs]
+        # Single walk of the tree, filtering by extension (lazy generator).
+        # Plain strings compare far faster than Path objects, so sort those
+        # and build Paths only for the files kept
+        found = (
+            os.path.join(root, name)
+            for root, _, names in self._walk()
+            for name in names
+            if os.path.splitext(name)[1].lower() in SUPPORTED_EXTENSIONS
+        )
+
+        # Sort and limit: a bounded heap keeps only max_docs paths in memory
+        # while giving the same result as sorted(...)[:max_docs]
+        if self.max_docs:
+            files = [Path(f) for f in heapq.nsmallest(self.max_docs, found)]
+        else:
+            files = [Path(f) for f in sorted(found)]
 
         self.stats['total_found'] = len(files)
         self.log(f"   Found {len(files)} supported files")
 
         return files
 
+    def _walk(self) -> Iterator[Tuple[str, List[str], List[str]]]:
+        """os.walk the folder, pruning hidden and tool/dependency directories."""
+        for root, dirs, names in os.walk(self.folder):
+            # Prune in place so os.walk never descends into them. SKIP_DIRS
+            # names follow skip_dirs alone, even the hidden ones (.git, .venv)
+            dirs[:] = [
+                d for d in dirs
+                if (not self.skip_dirs if d in SKIP_DIRS
+                    else self.include_hidden or not d.startswith('.'))
+            ]
+            yield root, dirs, names
+
     def extract_content(self, file: Path) -> tuple[str, bool]:
         """
         Extract text from document.
@@ -96,38 +265,83 @@ class DocumentSearcher:
             content = self.reader.read(file)
             return content, True
         except ReadError as e:
-            self.stats['skipped'] += 1
-            self.stats['errors'].append({
-                'file': str(file.relative_to(self.folder)),
-                'error': str(e)
-            })
+            self._record_error(file, e)
             return None, False
 
-    def _query_matches_path(self, file: Path) -> Tuple[bool, List[str], int]:
+    def iter_extract(self, files: List[Path]) -> Iterator[Tuple[Path, str]]:
+        """
+        Extract text from many documents concurrently.
+
+        Yields (file, content) in file order as soon as each document is
+        ready; unreadable files are recorded in stats and not yielded.
+
+        PDF and XLS files are read in up to `workers` processes, each with
+        its own DocumentReader; other formats (I/O, zip inflation and OCR
+        subprocesses, which release the GIL) on the reader's threads.
+        """
+        total = len(files)
+        in_processes = [file for file in files if file.suffix.lower() in PROCESS_EXTENSIONS]
+        in_threads = [file for file in files if file.suffix.lower() not in PROCESS_EXTENSIONS]
+
+        with contextlib.ExitStack() as stack:
+            process_results = iter(())
+            if in_processes:
+                # Submitted before the reader threads start, so the workers
+                # are forked from a single-threaded process
+                pool = stack.enter_context(ProcessPoolExecutor(
+                    max_workers=min(self.workers, len(in_processes)),
+                    initializer=_init_worker,
+                    initargs=(self.reader.cache_dir, self.reader.MAX_CHARS)
+                ))
+                process_results = iter([pool.submit(_extract_one, file) for file in in_processes])
+            thread_results = self.reader.iter_read(in_threads, max_workers=self.workers)
+
+            for done, file in enumerate(files, 1):
+                if file.suffix.lower() in PROCESS_EXTENSIONS:
+                    result = next(process_results).result()
+                else:
+                    _, result = next(thread_results)
+                self.log(f"   [{done}/{total}] {file.name}")
+                if isinstance(result, ReadError):
+                    self._record_error(file, result)
+                else:
+                    yield file, result
+
+    def _record_error(self, file: Path, error: ReadError):
+        """Count a skipped file and remember why."""
+        self.stats['skipped'] += 1
+        self.stats['errors'].append({
+            'file': str(file.relative_to(self.folder)),
+            'error': str(error)
+        })
+
+    def _query_matches_path(self, file: Path, path_str: Optional[str] = None) -> Tuple[bool, List[str], int]:
         """
         Check if query matches file path (filename or folder names).
 
         Args:
             file: Path to the file
+            path_str: Already-lowercased str(file), if the caller has it
 
         Returns:
             (is_match, matched_terms, relevance_score)
         """
-        path_str = str(file).lower()
-        filename = file.name.lower()
-
-        # Split query into terms (handle Chinese and English separators)
-        terms = re.split(r'[\s,，、;；]', self.query)
-        terms = [t.strip().lower() for t in terms if t.strip()]
+        if path_str is None:
+            path_str = str(file).lower()
 
-        matched = []
-        for term in terms:
-            if term in path_str:
-                matched.append(term)
+        if self._term_automaton is not None:
+            # One pass over the path finds every term occurrence
+            found = {term for _, term in self._term_automaton.iter(path_str)}
+            matched = [term for term in self.query_terms if term in found]
+        else:
+            matched = [term for term in self.query_terms if term in path_str]
 
         if not matched:
             return False, [], 0
 
+        filename = file.name.lower()
+        parent_blob = None
+
         # Calculate relevance based on match location
         relevance = 0
         for term in matched:
@@ -136,11 +350,13 @@ class DocumentSearcher:
                 relevance += 40
             # Parent folder name match: medium score
             else:
+                # Join parent names once per file, only when needed; the NUL
+                # separator keeps a term from matching across two names
+                if parent_blob is None:
+                    parent_blob = '\0'.join(parent.name for parent in file.parents).lower()
                 # Check if term is in any parent folder name
-                for parent in file.parents:
-                    if term in parent.name.lower():
-                        relevance += 30
-                        break
+                if term in parent_blob:
+                    relevance += 30
                 else:
                     # Path contains term but not in folder name (partial path match)
                     relevance += 20
@@ -163,55 +379,27 @@ class DocumentSearcher:
         # Prepare prompt for Claude
         docs_info = []
         for doc in documents:
-            # Truncate content for prompt
-            content_preview = doc['content'][:3000]
+            # Content is already truncated to CONTENT_PREVIEW_CHARS at extraction
             docs_info.append({
                 'file': str(doc['file'].relative_to(self.folder)),
-                'content_preview': content_preview
+                'content_preview': doc['content']
             })
 
-        prompt = f"""分析以下文档与查询的语义相关性：
-
-查询：{self.query}
-
-对每个文档评估：
-1. 相关性评分 (0-100)：
-   - 90-100: 直接且全面的回答
-   - 70-89: 高度相关，部分回答
-   - 50-69: 有些相关，边缘内容
-   - 30-49: 最小相关性
-   - 0-29: 不相关
-
-2. 内容摘要 (2-3 句话)：文档讨论了什么
-
-3. 相关摘录：2-3 个最相关的段落
-
-**重要 - 使用 OR 逻辑**：
-- 如果文档的任何部分与查询的任何概念相关，即标记为相关
-- 使用语义理解，不是关键词匹配
-- 考虑同义词、相关概念、上下文含义
-
-文档列表：
-{json.dumps(docs_info, ensure_ascii=False, indent=2)}
-
-请以 JSON 格式回复：
-{{
-  "analyses": [
-    {{
-      "file": "文件路径",
-      "relevance": 85,
-      "summary": "文档讨论了...",
-      "excerpts": ["摘录1", "摘录2"]
-    }}
-  ]
-}}"""
+        request = self.build_analysis_request(docs_info)
 
         # When running as skill, Claude will analyze this prompt
         # For now, return placeholder
         print("\n" + "="*60)
+        if not self._instructions_shown:
+            # The rubric is identical for every batch: show it once
+            print("📝 Claude Analysis Instructions (system, cached across batches):")
+            print("="*60)
+            print(request['system'][0]['text'])
+            print("="*60)
+            self._instructions_shown = True
         print("📝 Claude Analysis Prompt:")
         print("="*60)
-        print(prompt)
+        print(request['messages'][0]['content'])
         print("="*60)
         print("\n⚠️  Note: This script is designed to run as a Claude Code skill.")
         print("    Claude will analyze the documents and return structured results.")
@@ -220,6 +408,44 @@ class DocumentSearcher:
         # Placeholder results
         return []
 
+    def build_analysis_request(self, docs_info: List[Dict[str, str]]) -> Dict[str, Any]:
+        """
+        Build a Messages API payload for one batch of documents.
+
+        The static scoring rubric is the system block, marked for prompt
+        caching, so every batch after the first reuses the cached prefix.
+        Only the query and the batch's documents go in the user message.
+
+        Args:
+            docs_info: List of dicts with 'file' and 'content_preview' keys
+
+        Returns:
+            Dict with 'system' and 'messages' keys
+        """
+        return {
+            'system': [{
+                'type': 'text',
+                'text': ANALYSIS_INSTRUCTIONS,
+                'cache_control': {'type': 'ephemeral'}
+            }],
+            'messages': [{
+                'role': 'user',
+                'content': (
+                    f"查询：{self.query}\n\n"
+                    f"文档列表：\n{json.dumps(docs_info, ensure_ascii=False, indent=2)}"
+                )
+            }]
+        }
+
+    def _analyze_batch(self, batch_num: int, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Analyze one batch of extracted documents."""
+        if batch_num == 1:
+            self.log(f"\n🤖 Analyzing document content for: '{self.query}'")
+        self.log(f"   🔄 Batch {batch_num} ({len(batch)} docs)...")
+
+        # This will be handled by Claude when running as skill
+        return self.analyze_with_claude(batch)
+
     def search(self) -> List[Dict[str, Any]]:
         """
         Execute search with progress tracking.
@@ -236,10 +462,13 @@ class DocumentSearcher:
         # Step 1.5: Path matching (check filenames and folder names)
         self.log(f"\n🔍 Checking file/folder names for: '{self.query}'")
         path_match_results = {}
-        for file in files:
-            is_match, matched_terms, relevance = self._query_matches_path(file)
+        path_keys = [str(file) for file in files]
+        # Lowercase every path in one call; paths never contain NUL
+        lowered = '\0'.join(path_keys).lower().split('\0')
+        for file, key, path_str in zip(files, path_keys, lowered):
+            is_match, matched_terms, relevance = self._query_matches_path(file, path_str)
             if is_match:
-                path_match_results[str(file)] = {
+                path_match_results[key] = {
                     'file': file,
                     'path_relevance': relevance,
                     'matched_terms': matched_terms
@@ -249,50 +478,61 @@ class DocumentSearcher:
         if path_match_count > 0:
             self.log(f"   ✅ Found {path_match_count} files with matching names")
 
-        # Step 2: Extract content from all files
-        self.log(f"\n📄 Extracting content from {len(files)} files...")
+        # Step 1.6: Confident path matches skip extraction entirely
+        to_extract = files
+        if self.path_only_threshold is not None:
+            # Only actual path matches can skip extraction
+            to_extract = [
+                file for file in files
+                if str(file) not in path_match_results
+                or path_match_results[str(file)]['path_relevance'] < self.path_only_threshold
+            ]
+            skipped_by_path = len(files) - len(to_extract)
+            if skipped_by_path:
+                self.log(f"   ⏭️  {skipped_by_path} files matched by name "
+                         f"(≥{self.path_only_threshold}), content not extracted")
 
-        documents = []
-        for i, file in enumerate(files, 1):
-            progress = f"   [{i}/{len(files)}] {file.name}"
-            self.log(progress)
+        # Steps 2-3: Extract content and analyze it in batches as it arrives,
+        # so analysis of early batches overlaps extraction of later files
+        self.log(f"\n📄 Extracting content from {len(to_extract)} files...")
+        self.log(f"   Workers: {self.workers} | Batch size: {self.batch_size}")
 
-            content, success = self.extract_content(file)
-            if success and content.strip():
-                documents.append({
-                    'file': file,
-                    'content': content
-                })
-                self.stats['successfully_read'] += 1
+        all_analyses = []
+        batch = []
+        batch_num = 0
+        for file, content in self.iter_extract(to_extract):
+            if not content.strip():
+                continue
+            batch.append({
+                'file': file,
+                'content': content[:self.CONTENT_PREVIEW_CHARS]
+            })
+            self.stats['successfully_read'] += 1
 
-        self.log(f"   ✅ Successfully read: {self.stats['successfully_read']} files")
+            if len(batch) >= self.batch_size:
+                batch_num += 1
+                all_analyses.extend(self._analyze_batch(batch_num, batch))
+                batch = []
+
+        # Remaining partial batch (only if we have content)
+        if batch:
+            batch_num += 1
+            all_analyses.extend(self._analyze_batch(batch_num, batch))
+
+        self.log(f"\n   ✅ Successfully read: {self.stats['successfully_read']} files")
         if self.stats['skipped'] > 0:
             self.log(f"   ⚠️  Skipped: {self.stats['skipped']} files")
 
-        if not documents:
+        if not self.stats['successfully_read']:
             self.log("\n   No content could be extracted!")
 
-        # Step 3: Process in batches (only if we have content)
-        all_analyses = []
-        if documents:
-            self.log(f"\n🤖 Analyzing document content for: '{self.query}'")
-            self.log(f"   Batch size: {self.batch_size} | Batches: {(len(documents) + self.batch_size - 1) // self.batch_size}")
-
-            batches = [
-                documents[i:i + self.batch_size]
-                for i in range(0, len(documents), self.batch_size)
-            ]
-
-            for batch_num, batch in enumerate(batches, 1):
-                self.log(f"   🔄 Batch {batch_num}/{len(batches)} ({len(batch)} docs)...")
-
-                # This will be handled by Claude when running as skill
-                analyses = self.analyze_with_claude(batch)
-                all_analyses.extend(analyses)
-
         # Step 4: Merge path matches with content matches
-        # Track which files had content analysis
-        content_analyzed_files = {a.get('file', ''): a for a in all_analyses}
+        # Track which files had content analysis. Analyses name files
+        # relative to the folder (as in the prompt); key them like
+        # path_match_results, by the full path string
+        content_analyzed_files = {
+            str(self.folder / a.get('file', '')): a for a in all_analyses
+        }
 
         final_results = []
 
@@ -329,18 +569,19 @@ class DocumentSearcher:
                 })
 
         # Add content-only matches (no path match)
-        for analysis in all_analyses:
-            file_key = str(analysis.get('file', ''))
+        for file_key, analysis in content_analyzed_files.items():
             if file_key not in path_match_results:
+                analysis['file'] = Path(file_key)
                 analysis['match_sources'] = ['content']
+                analysis.setdefault('relevance', 0)
                 final_results.append(analysis)
 
-        # Filter by relevance threshold
-        matched = [
-            r for r in final_results
-            if r.get('relevance', 0) >= self.RELEVANCE_THRESHOLD
-        ]
-        matched.sort(key=lambda x: x.get('relevance', 0), reverse=True)
+        # Filter by relevance threshold, most relevant first
+        relevant = (r for r in final_results if r['relevance'] >= self.RELEVANCE_THRESHOLD)
+        if self.max_docs:
+            matched = heapq.nlargest(self.max_docs, relevant, key=itemgetter('relevance'))
+        else:
+            matched = sorted(relevant, key=itemgetter('relevance'), reverse=True)
 
         self.stats['matched'] = len(matched)
         self.log(f"\n   📊 Results: {len(matched)} relevant documents found")
@@ -349,7 +590,15 @@ class DocumentSearcher:
 
     def generate_report(self, results: List[Dict[str, Any]], output_path: Path):
         """Generate Markdown report."""
-        report_lines = [
+        # Write straight into one buffer instead of collecting a list of lines
+        report = io.StringIO()
+
+        def write(*lines: str):
+            for line in lines:
+                report.write(line)
+                report.write("\n")
+
+        write(
             "# Document Search Results",
             "",
             f"**Query:** `{self.query}`",
@@ -359,11 +608,11 @@ class DocumentSearcher:
             "",
             "---",
             ""
-        ]
+        )
 
         # Matched documents
         if results:
-            report_lines.append("## Matched Documents\n")
+            write("## Matched Documents\n")
 
             for i, result in enumerate(results, 1):
                 relevance = result.get('relevance', 0)
@@ -375,16 +624,12 @@ class DocumentSearcher:
 
                 # Get just the filename for heading
                 file_name = Path(file_path).name
-                if file_name != file_path:
-                    file_info = f"{file_name}\n**File:** `{file_path}`"
-                else:
-                    file_info = f"`{file_path}`"
 
                 # Add match source badge
                 source_badge = " 🔍" if 'path' in match_sources else ""
 
-                report_lines.append(f"### {i}. {file_name}{source_badge}")
-                report_lines.append(f"**Relevance:** {relevance}/100")
+                write(f"### {i}. {file_name}{source_badge}")
+                write(f"**Relevance:** {relevance}/100")
 
                 # Show match sources if path match
                 if 'path' in match_sources:
@@ -393,29 +638,29 @@ class DocumentSearcher:
                         source_labels.append("文件/文件夹名")
                     if 'content' in match_sources:
                         source_labels.append("内容")
-                    report_lines.append(f"**Match Sources:** {', '.join(source_labels)}")
+                    write(f"**Match Sources:** {', '.join(source_labels)}")
 
                     # Show matched terms
                     if matched_terms:
-                        report_lines.append(f"**Matched Terms:** {', '.join(matched_terms)}")
+                        write(f"**Matched Terms:** {', '.join(matched_terms)}")
 
                     # Show breakdown if both matches
                     if 'content' in match_sources:
                         path_rel = result.get('path_relevance', 0)
                         content_rel = result.get('content_relevance', 0)
-                        report_lines.append(f"**Score Breakdown:** 路径匹配 {path_rel} + 内容匹配 {content_rel}")
+                        write(f"**Score Breakdown:** 路径匹配 {path_rel} + 内容匹配 {content_rel}")
 
-                report_lines.append(f"**Summary:** {summary}")
+                write(f"**Summary:** {summary}")
 
                 if excerpts:
-                    report_lines.append("\n**Relevant Excerpts:**")
+                    write("\n**Relevant Excerpts:**")
                     for excerpt in excerpts:
-                        report_lines.append(f"> {excerpt}")
+                        write(f"> {excerpt}")
 
-                report_lines.append("\n---\n")
+                write("\n---\n")
 
         # Statistics
-        report_lines.extend([
+        write(
             "## Statistics\n",
             "| Metric | Count |",
             "|--------|-------|",
@@ -424,31 +669,27 @@ class DocumentSearcher:
             f"| Relevant matches (≥{self.RELEVANCE_THRESHOLD}%) | {self.stats['matched']} |",
             f"| Files skipped (errors) | {self.stats['skipped']} |",
             ""
-        ])
+        )
 
         # Skipped files
         if self.stats['errors']:
-            report_lines.append("## Skipped Files\n")
+            write("## Skipped Files\n")
             for error in self.stats['errors']:
-                report_lines.append(f"- `{error['file']}` - {error['error']}")
-            report_lines.append("")
+                write(f"- `{error['file']}` - {error['error']}")
+            write("")
 
         # Footer
-        report_lines.extend([
-            "---",
-            "",
-            "*Generated by Document AI Search skill*"
-        ])
+        write("---", "")
+        report.write("*Generated by Document AI Search skill*")
 
         # Write report
-        report_content = "\n".join(report_lines)
-        output_path.write_text(report_content, encoding='utf-8')
+        output_path.write_text(report.getvalue(), encoding='utf-8')
 
         self.log(f"\n✅ Report saved to: {output_path}")
 
 
-def main():
-    """CLI entry point."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (shared with the search daemon)."""
     parser = argparse.ArgumentParser(
         description="AI-powered semantic document search",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -494,22 +735,76 @@ Examples:
         help="Maximum documents to process (default: 50)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=default_workers(),
+        metavar="N",
+        help="Parallel extraction workers, at least 1 (default: CPU count - 1)"
+    )
+
+    parser.add_argument(
+        "--path-only-threshold",
+        type=path_score,
+        default=None,
+        metavar="N",
+        help="Skip content extraction for files whose name/folder match scores >= N, 1-100 "
+             "(default: disabled)"
+    )
+
+    parser.add_argument(
+        "--include-hidden",
+        action="store_true",
+        help="Also search hidden directories (names starting with '.')"
+    )
+
+    parser.add_argument(
+        "--no-skip-dirs",
+        action="store_true",
+        help="Also search .git, .venv, .cache, node_modules, venv, __pycache__, dist and build "
+             "(even without --include-hidden)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the extraction cache"
+    )
+
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Search in this process even if a search daemon is running"
+    )
+
     parser.add_argument(
         "-q", "--quiet",
         action="store_true",
         help="Suppress progress output"
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def run(args: argparse.Namespace, reader: Optional[DocumentReader] = None) -> int:
+    """
+    Run one search from parsed arguments and write its report.
 
+    Args:
+        args: Namespace from build_parser()
+        reader: DocumentReader to reuse (the daemon keeps one warm)
+
+    Returns:
+        Process exit code
+    """
     # Validate folder
     if not args.folder.exists():
         print(f"❌ Error: Folder not found: {args.folder}", file=sys.stderr)
-        sys.exit(1)
+        return 1
 
     if not args.folder.is_dir():
         print(f"❌ Error: Not a folder: {args.folder}", file=sys.stderr)
-        sys.exit(1)
+        return 1
 
     # Create searcher
     searcher = DocumentSearcher(
@@ -517,7 +812,13 @@ Examples:
         query=args.query,
         batch_size=args.batch_size,
         max_docs=args.max_docs,
-        verbose=not args.quiet
+        workers=args.workers,
+        path_only_threshold=args.path_only_threshold,
+        include_hidden=args.include_hidden,
+        skip_dirs=not args.no_skip_dirs,
+        use_cache=not args.no_cache,
+        verbose=not args.quiet,
+        reader=reader
     )
 
     # Execute search
@@ -529,10 +830,24 @@ Examples:
     # Exit with appropriate code
     if results:
         print(f"\n🎉 Found {len(results)} relevant documents!")
-        sys.exit(0)
     else:
         print(f"\n📭 No relevant documents found.")
-        sys.exit(0)
+    return 0
+
+
+def main():
+    """CLI entry point."""
+    args = build_parser().parse_args()
+
+    # A running daemon already has the readers imported and warm.
+    # search_daemon needs Unix sockets even to import.
+    if not args.no_daemon and hasattr(socket, 'AF_UNIX'):
+        from search_daemon import forward
+        exit_code = forward(sys.argv[1:])
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    sys.exit(run(args))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,196 @@
+"""Tests for DocumentReader format handling."""
+
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from file_reader import DocumentReader, ReadError  # noqa: E402
+
+try:
+    from PIL import Image, ImageDraw
+except ImportError:
+    Image = None
+
+try:
+    import pypdf
+except ImportError:
+    pypdf = None
+
+
+@unittest.skipIf(Image is None, "Pillow not installed")
+class OcrImageTest(unittest.TestCase):
+    """_load_ocr_image must keep dark text on a light background for every image mode."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self._tmp.name)
+        self.reader = DocumentReader(cache_dir=None)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _assert_readable(self, image, name: str, **save_options):
+        path = self.folder / name
+        image.save(path, **save_options)
+
+        loaded = self.reader._load_ocr_image(path)
+        self.assertEqual(loaded.mode, 'L')
+        # Background white, text still dark
+        self.assertEqual(loaded.getpixel((0, 0)), 255)
+        self.assertLess(loaded.getextrema()[0], 128)
+
+    def test_transparent_background(self):
+        image = Image.new('RGBA', (200, 60), (0, 0, 0, 0))
+        ImageDraw.Draw(image).text((10, 20), 'HELLO', fill=(0, 0, 0, 255))
+        self._assert_readable(image, 'rgba.png')
+
+    def test_palette_with_transparency(self):
+        # Index 0 (background) is transparent black, index 1 (text) opaque black
+        image = Image.new('P', (200, 60), 0)
+        image.putpalette([0, 0, 0, 0, 0, 0])
+        ImageDraw.Draw(image).text((10, 20), 'HELLO', fill=1)
+        self._assert_readable(image, 'palette.png', transparency=0)
+
+    def test_16_bit_grayscale(self):
+        image = Image.new('I', (200, 60), 60000)
+        ImageDraw.Draw(image).text((10, 20), 'HELLO', fill=2000)
+        self._assert_readable(image.convert('I;16'), 'gray16.png')
+
+    def test_rgb(self):
+        image = Image.new('RGB', (200, 60), 'white')
+        ImageDraw.Draw(image).text((10, 20), 'HELLO', fill='black')
+        self._assert_readable(image, 'rgb.jpg')
+
+
+_XLSX_MAIN = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_XLSX_RELS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+# Cell styles: 0 general, 1 built-in date (14), 2 custom datetime,
+# 3 elapsed hours, 4 percent, 5 number with a quoted literal ("days")
+_XLSX_STYLES = f"""<styleSheet xmlns="{_XLSX_MAIN}">
+<numFmts count="4">
+<numFmt numFmtId="164" formatCode="yyyy-mm-dd hh:mm"/>
+<numFmt numFmtId="165" formatCode="[h]:mm"/>
+<numFmt numFmtId="166" formatCode="0.00%"/>
+<numFmt numFmtId="167" formatCode="0 &quot;days&quot;"/>
+</numFmts>
+<cellXfs count="6">
+<xf numFmtId="0"/><xf numFmtId="14"/><xf numFmtId="164"/>
+<xf numFmtId="165"/><xf numFmtId="166"/><xf numFmtId="167"/>
+</cellXfs>
+</styleSheet>"""
+
+
+def _write_xlsx(path: Path, cells, date1904: bool = False):
+    """Write a one-row workbook of numeric cells given as (value, style index) pairs."""
+    row = ''.join(f'<c r="{chr(65 + i)}1" s="{style}"><v>{value}</v></c>'
+                  for i, (value, style) in enumerate(cells))
+    with zipfile.ZipFile(path, 'w') as xlsx:
+        xlsx.writestr('xl/workbook.xml', (
+            f'<workbook xmlns="{_XLSX_MAIN}" xmlns:r="{_XLSX_RELS}">'
+            f'<workbookPr date1904="{int(date1904)}"/>'
+            '<sheets><sheet name="Data" sheetId="1" r:id="rId1"/></sheets></workbook>'
+        ))
+        xlsx.writestr('xl/_rels/workbook.xml.rels', (
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Target="worksheets/sheet1.xml"/></Relationships>'
+        ))
+        xlsx.writestr('xl/styles.xml', _XLSX_STYLES)
+        xlsx.writestr('xl/worksheets/sheet1.xml', (
+            f'<worksheet xmlns="{_XLSX_MAIN}"><sheetData><row r="1">{row}</row></sheetData></worksheet>'
+        ))
+
+
+class XlsxDateTest(unittest.TestCase):
+    """Date-formatted XLSX cells print like openpyxl's datetime/time/timedelta values."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / 'book.xlsx'
+        self.reader = DocumentReader(cache_dir=None)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _row(self, cells, date1904: bool = False) -> str:
+        _write_xlsx(self.path, cells, date1904)
+        header, row = self.reader.read(self.path).split('\n')
+        self.assertEqual(header, 'Sheet: Data')
+        return row
+
+    def test_date_formats(self):
+        row = self._row([(45123, 1), (45123.5, 2), (0.5, 1), (1.25, 3), (45123, 0), (0.125, 4), (3, 5)])
+        self.assertEqual(row, ' | '.join([
+            '2023-07-16 00:00:00', '2023-07-16 12:00:00', '12:00:00',
+            '1 day, 6:00:00', '45123', '0.125', '3',
+        ]))
+
+    def test_1900_leap_year_bug(self):
+        self.assertEqual(self._row([(59, 1), (61, 1)]), '1900-02-28 00:00:00 | 1900-03-01 00:00:00')
+
+    def test_1904_date_system(self):
+        self.assertEqual(self._row([(43661, 1)], date1904=True), '2023-07-16 00:00:00')
+
+    def test_out_of_range_serial_only_affects_its_cell(self):
+        row = self._row([(99999999, 1), (-700000, 2), (45123, 1)])
+        self.assertEqual(row, '#VALUE! | #VALUE! | 2023-07-16 00:00:00')
+
+    def test_missing_workbook_is_read_error(self):
+        with zipfile.ZipFile(self.path, 'w') as xlsx:
+            xlsx.writestr('xl/styles.xml', _XLSX_STYLES)
+        with self.assertRaises(ReadError):
+            self.reader.read(self.path)
+
+
+def _write_pdf(path: Path, contents):
+    """Write a PDF with one page per content stream (Helvetica as /F1)."""
+    count = len(contents)
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [%s] /Count %d >>'
+        % (b' '.join(b'%d 0 R' % (4 + 2 * i) for i in range(count)), count),
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    for i, content in enumerate(contents):
+        objects.append(b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 300 300] '
+                       b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % (5 + 2 * i))
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(content), content))
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    out += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+
+
+@unittest.skipIf(pypdf is None, "pypdf not installed")
+class PypdfTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / 'doc.pdf'
+        self.reader = DocumentReader(cache_dir=None)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_upright_and_rotated_pages(self):
+        _write_pdf(self.path, [
+            b'BT /F1 12 Tf 10 50 Td (Portrait notes) Tj ET',
+            # Landscape output: text drawn through a 90-degree CTM
+            b'q 0 1 -1 0 300 0 cm BT /F1 12 Tf 10 50 Td (Landscape budget table) Tj ET Q',
+        ])
+        self.assertEqual(self.reader._read_pdf_pypdf(self.path), 'Portrait notes\n\nLandscape budget table')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Tests for merging path matches with content analyses in DocumentSearcher.search()."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from search_documents import DocumentSearcher  # noqa: E402
+
+
+class MergeResultsTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = Path(self._tmp.name)
+        (self.folder / 'reports').mkdir()
+        (self.folder / 'reports' / 'budget_2024.txt').write_text('annual budget figures', encoding='utf-8')
+        (self.folder / 'notes.txt').write_text('meeting notes about the budget', encoding='utf-8')
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _search(self, analyses):
+        searcher = DocumentSearcher(self.folder, 'budget', use_cache=False, verbose=False, workers=1)
+        # Analyses name files relative to the folder, as in the analysis prompt
+        searcher.analyze_with_claude = lambda documents: [
+            dict(analysis) for analysis in analyses
+            if any(str(doc['file'].relative_to(self.folder)) == analysis['file'] for doc in documents)
+        ]
+        return searcher.search()
+
+    def test_path_and_content_match_is_merged(self):
+        relative = str(Path('reports') / 'budget_2024.txt')
+        results = self._search([{'file': relative, 'relevance': 60, 'summary': 'Budget', 'excerpts': []}])
+
+        matches = [r for r in results if r['file'] == self.folder / relative]
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0]['match_sources'], ['path', 'content'])
+        self.assertEqual(matches[0]['content_relevance'], 60)
+        self.assertEqual(matches[0]['relevance'], 72)
+
+    def test_content_only_match_gets_full_path(self):
+        results = self._search([{'file': 'notes.txt', 'relevance': 50, 'summary': 'Notes', 'excerpts': []}])
+
+        matches = [r for r in results if r['file'] == self.folder / 'notes.txt']
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0]['match_sources'], ['content'])
+
+
+if __name__ == '__main__':
+    unittest.main()